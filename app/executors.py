@@ -0,0 +1,171 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+
+def _warm_worker():
+    import numpy  # noqa: F401
+    import src.fresnel_transform  # noqa: F401
+    import src.image_utils  # noqa: F401
+
+
+def _noop():
+    return None
+
+
+def fresnel_task(img, z, D, wl):
+    from src.fresnel_transform import fresnel_frft_square_input
+    from src.image_utils import normalize_result
+    return normalize_result(fresnel_frft_square_input(img, z, D, wl))
+
+
+class SweepExecutor(ABC):
+    """
+    Runs a parameter sweep over one or more input images.
+
+    `tasks` is a list of tuples (input_idx, *args); each task computes
+    func(inputs[input_idx], *args). Results are returned in task order and
+    `on_progress(done, total)` is called as each task finishes.
+    """
+
+    @abstractmethod
+    def run_sweep(self, func, inputs, tasks, on_progress=None):
+        pass
+
+    def warm_up(self):
+        pass
+
+
+class LocalProcessExecutor(SweepExecutor):
+    """
+    Long-lived local process pool. Workers import NumPy and the transform
+    module on start, so only the first warm_up() pays the spawn cost.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None
+        # Shared by every session: guards creating and discarding the pool
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_worker)
+            return self._pool
+
+    def _discard_pool(self, pool):
+        pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+
+    def warm_up(self):
+        with self._lock:
+            if self._pool is not None:
+                return
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_worker)
+            for _ in range(self.max_workers):
+                self._pool.submit(_noop)
+
+    def run_sweep(self, func, inputs, tasks, on_progress=None):
+        outs = [None] * len(tasks)
+        total = len(tasks)
+
+        executor = self._get_pool()
+        futures = {}
+
+        completadas = 0
+        try:
+            for i, (input_idx, *args) in enumerate(tasks):
+                futures[executor.submit(func, inputs[input_idx], *args)] = i
+
+            for f in as_completed(futures):
+                outs[futures[f]] = f.result()
+                completadas += 1
+                if on_progress is not None:
+                    on_progress(completadas, total)
+        except BrokenProcessPool:
+            self._discard_pool(executor)
+            raise
+        except BaseException:
+            # The pool is shared across sessions: free it from this sweep's pending work
+            for f in futures:
+                f.cancel()
+            raise
+
+        return outs
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+
+class DaskExecutor(SweepExecutor):
+    """
+    Distributes the sweep over a Dask cluster.
+
+    Pass `address` to connect to a running scheduler, or any
+    `distributed.Client` keyword (e.g. processes=False for an in-process
+    local cluster). Each input is scattered once to every worker.
+    """
+
+    def __init__(self, address=None, client=None, **client_kwargs):
+        try:
+            from distributed import Client
+        except ImportError as e:
+            raise ImportError(
+                "DaskExecutor requiere 'dask[distributed]': pip install \"dask[distributed]\""
+            ) from e
+
+        self.client = client if client is not None else Client(address, **client_kwargs)
+
+    def run_sweep(self, func, inputs, tasks, on_progress=None):
+        from distributed import as_completed as dask_as_completed
+
+        outs = [None] * len(tasks)
+        total = len(tasks)
+
+        remote_inputs = self.client.scatter(list(inputs), broadcast=True)
+        futures = {
+            self.client.submit(func, remote_inputs[input_idx], *args, pure=False): i
+            for i, (input_idx, *args) in enumerate(tasks)
+        }
+
+        completadas = 0
+        for f in dask_as_completed(list(futures)):
+            outs[futures[f]] = f.result()
+            completadas += 1
+            if on_progress is not None:
+                on_progress(completadas, total)
+
+        return outs
+
+    def close(self):
+        self.client.close()
+
+
+def selected_backend():
+    return os.environ.get("FRESNEL_EXECUTOR", "local").lower()
+
+
+@lru_cache(maxsize=None)
+def get_executor():
+    """
+    Returns the sweep executor selected by FRESNEL_EXECUTOR ("local" by
+    default, or "dask" with the scheduler in FRESNEL_DASK_SCHEDULER).
+    """
+    backend = selected_backend()
+    if backend == "local":
+        return LocalProcessExecutor()
+    if backend == "dask":
+        address = os.environ.get("FRESNEL_DASK_SCHEDULER")
+        if not address:
+            raise ValueError("FRESNEL_EXECUTOR=dask requiere la dirección del scheduler en FRESNEL_DASK_SCHEDULER")
+        return DaskExecutor(address)
+    raise ValueError(f"FRESNEL_EXECUTOR desconocido: {backend}")
@@ -18,6 +18,7 @@ from app.processing_flows import (
     process_video_export,
     process_zip_export
 )
+from app.executors import get_executor, selected_backend
 from app.ui_texts import INTRO_TEXT, HELP_TEXT
 
 st.set_page_config(
@@ -26,6 +27,17 @@ st.set_page_config(
     layout="wide"
 )
 
+
+@st.cache_resource(show_spinner=False)
+def warm_up_worker_pool():
+    # Cached per server process: only the first session pays for spawning the local
+    # workers. Remote backends connect on the first "Calcular" instead.
+    if selected_backend() == "local":
+        get_executor().warm_up()
+
+
+warm_up_worker_pool()
+
 st.title("Patrón de Intensidad de un Frente de Onda")
 
 tab1, tab2 = st.tabs(["📘 Inicio", "🖥️ Simulación"])
@@ -1,73 +1,54 @@
-from io import BytesIO
-import os
-import zipfile
 import streamlit as st
 import numpy as np
 from app.ui_helpers import render_image_section, crop_center_square, select_video_channel, choose_fps, render_video_download_button
 from src.image_utils import array_to_image_bytes, recombine_rgb_channels
-from src.video_utils import generate_video_from_arrays
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from app.executors import get_executor, fresnel_task
 
 
-def _run_fresnel_grayscale(args):
-    img, z, D = args
-    from src.fresnel_transform import fresnel_frft_square_input
-    from src.image_utils import normalize_result
-    return normalize_result(fresnel_frft_square_input(img, z, D, 530e-9))
+def _load_executor():
+    try:
+        return get_executor()
+    except (ImportError, ValueError, OSError) as e:
+        st.session_state["executor_error"] = f"❌ No se pudo iniciar el backend de cálculo: {e}"
+        return None
 
-def compute_grayscale_outputs(img, z_vals, D):
-    futures = []
-    outs = [None] * len(z_vals)
 
-    with ProcessPoolExecutor() as executor:
-        for i, z in enumerate(z_vals):
-            future = executor.submit(_run_fresnel_grayscale, (img, z, D))
-            futures.append((i, future))
+def _show_executor_error():
+    error = st.session_state.pop("executor_error", None)
+    if error:
+        st.error(error)
 
-        progress_bar = st.progress(0, text="Calculando escala de Grises...")
-        completadas = 0
-        total = len(z_vals)
 
-        for f in as_completed([f for _, f in futures]):
-            idx = next(i for i, fut in futures if fut == f)
-            outs[idx] = f.result()
-            completadas += 1
-            progress_bar.progress(completadas / total, text=f"Grises: {completadas}/{total}")
+def compute_grayscale_outputs(img, z_vals, D):
+    executor = _load_executor()
+    if executor is None:
+        return None
 
-    return outs
+    progress_bar = st.progress(0, text="Calculando escala de Grises...")
+    tasks = [(0, z, D, 530e-9) for z in z_vals]
 
+    def on_progress(completadas, total):
+        progress_bar.progress(completadas / total, text=f"Grises: {completadas}/{total}")
 
-def _run_fresnel_rgb(args):
-    channel, z, D, wl = args
-    from src.fresnel_transform import fresnel_frft_square_input
-    from src.image_utils import normalize_result
-    return normalize_result(fresnel_frft_square_input(channel, z, D, wl))
+    return executor.run_sweep(fresnel_task, [img], tasks, on_progress)
 
-def compute_rgb_outputs(r, g, b, z_vals, D):
-    def compute_channel(channel, wl, label):
-        futures = []
-        outs = [None] * len(z_vals)
 
-        with ProcessPoolExecutor() as executor:
-            for i, z in enumerate(z_vals):
-                future = executor.submit(_run_fresnel_rgb, (channel, z, D, wl))
-                futures.append((i, future))
+def compute_rgb_outputs(r, g, b, z_vals, D):
+    executor = _load_executor()
+    if executor is None:
+        return None
 
-            progress_bar = st.progress(0, text=f"Calculando canal {label}...")
-            completadas = 0
-            total = len(z_vals)
+    wavelengths = [560e-9, 530e-9, 430e-9]
+    progress_bar = st.progress(0, text="Calculando canales RGB...")
+    tasks = [(c, z, D, wl) for c, wl in enumerate(wavelengths) for z in z_vals]
 
-            for f in as_completed([f for _, f in futures]):
-                idx = next(i for i, fut in futures if fut == f)
-                outs[idx] = f.result()
-                completadas += 1
-                progress_bar.progress(completadas / total, text=f"Canal {label}: {completadas}/{total}")
+    def on_progress(completadas, total):
+        progress_bar.progress(completadas / total, text=f"Canales RGB: {completadas}/{total}")
 
-        return outs
+    outs = executor.run_sweep(fresnel_task, [r, g, b], tasks, on_progress)
 
-    r_outs = compute_channel(r, 560e-9, "Rojo")
-    g_outs = compute_channel(g, 530e-9, "Verde")
-    b_outs = compute_channel(b, 430e-9, "Azul")
+    n = len(z_vals)
+    r_outs, g_outs, b_outs = outs[:n], outs[n:2 * n], outs[2 * n:]
 
     rgb_outs = [
         (np.stack([r_outs[i], g_outs[i], b_outs[i]], axis=-1) * 255).astype(np.uint8)
@@ -113,8 +94,11 @@ def display_image_pair_at_z(label, original, outs, z_vals, key_prefix, idx):
 
 def process_grayscale_mode(img, z_vals, D, apply_button, idx):
     crop_center_square(img)
+    _show_executor_error()
     if apply_button:
-        st.session_state['gray_outs'] = compute_grayscale_outputs(img, z_vals, D)
+        gray_outs = compute_grayscale_outputs(img, z_vals, D)
+        if gray_outs is not None:
+            st.session_state['gray_outs'] = gray_outs
 
     display_image_pair_at_z("Imagen en escala de grises", img, st.session_state.get('gray_outs'), z_vals, "grises", idx)
 
@@ -125,8 +109,11 @@ def process_rgb_mode(data, z_vals, D, apply_button, idx):
     g = crop_center_square(g)
     b = crop_center_square(b)
 
+    _show_executor_error()
     if apply_button:
-        st.session_state.update(compute_rgb_outputs(r, g, b, z_vals, D))
+        rgb_results = compute_rgb_outputs(r, g, b, z_vals, D)
+        if rgb_results is not None:
+            st.session_state.update(rgb_results)
 
     rgb_img = (recombine_rgb_channels(r, g, b) * 255).astype(np.uint8)
     st.session_state['rgb_original'] = rgb_img
@@ -205,10 +192,14 @@ def process_video_export():
         st.caption(f"Duración estimada: {duracion:.2f} segundos")
 
     if st.button("🎞️ Generar vídeo"):
+        from src.video_utils import generate_video_from_arrays
         ruta = generate_video_from_arrays(outs, fps, z_vals=z_vals)
         render_video_download_button(ruta, canal)
 
 def process_zip_export():
+    from io import BytesIO
+    import zipfile
+
     def create_channel_zip(channel_name, key, z_vals):
         outs = st.session_state.get(key)
         if not outs or not z_vals:
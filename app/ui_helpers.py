@@ -1,8 +1,20 @@
 import streamlit as st
-from PIL import Image
-from src.image_utils import array_to_image_bytes, load_image_auto_channels
+from src.image_utils import array_to_image_bytes, load_image_auto_channels, load_example_images, buffer_to_channels
+from functools import lru_cache
 import os
-import glob
+
+
+# Decoded once per server process and shared read-only across sessions
+EXAMPLE_IMAGES = load_example_images("assets")
+
+
+@lru_cache(maxsize=2)
+def get_example_channels(nombre):
+    mode, buffer, max_val = EXAMPLE_IMAGES[nombre]
+    channels = buffer_to_channels(mode, buffer, max_val)
+    for channel in channels:
+        channel.flags.writeable = False
+    return mode, channels
 
 
 def clear_previous_results():
@@ -37,20 +49,22 @@ def handle_uploaded_image():
         st.rerun()
 
     if uploaded_file is not None:
-        if "last_image_name" not in st.session_state or uploaded_file.name != st.session_state["last_image_name"]:
+        if "last_image_name" not in st.session_state or uploaded_file.file_id != st.session_state["last_image_name"]:
             clear_previous_results()
-            st.session_state["last_image_name"] = uploaded_file.name
+            st.session_state["last_image_name"] = uploaded_file.file_id
+            st.session_state.pop("mode", None)
+            st.session_state.pop("data", None)
+        elif "mode" in st.session_state and "data" in st.session_state:
+            return st.session_state["mode"], st.session_state["data"]
 
         try:
-            img = Image.open(uploaded_file)
-            if img.mode not in ["RGB", "L"]:
-                st.error("❌ La imagen debe estar en formato RGB o en escala de grises.")
-                return None, None
-
             mode, data = load_image_auto_channels(uploaded_file)
             st.session_state["mode"] = mode
             st.session_state["data"] = data
             return mode, data
+        except ValueError:
+            st.error("❌ La imagen debe estar en formato RGB o en escala de grises.")
+            return None, None
         except Exception as e:
             st.error(f"❌ Error al procesar la imagen: {e}")
             return None, None
@@ -74,7 +88,7 @@ def handle_example_image_selection():
         "triangle.png": "Triángulo",
     }
 
-    imagenes_ejemplo = [os.path.basename(f) for f in glob.glob("assets/*.png")]
+    imagenes_ejemplo = list(EXAMPLE_IMAGES)
     if not imagenes_ejemplo:
         st.warning("⚠️ No se encontraron imágenes de ejemplo.")
         return None, None
@@ -91,7 +105,7 @@ def handle_example_image_selection():
     if "last_image_name" not in st.session_state or path_ejemplo != st.session_state["last_image_name"]:
         clear_previous_results()
         st.session_state["last_image_name"] = path_ejemplo
-    return load_image_auto_channels(path_ejemplo)
+    return get_example_channels(imagenes_ejemplo[idx])
 
 
 def render_image_section(title, image_array, filename):
@@ -1,24 +1,72 @@
 import numpy as np
 from PIL import Image
 from io import BytesIO
+import glob
+import os
+import warnings
 
-def load_rgb_channels(uploaded_file):
-    img = Image.open(uploaded_file).convert('RGB')
-    r, g, b = img.split()
-    return np.array(r) / 255.0, np.array(g) / 255.0, np.array(b) / 255.0
+GRAYSCALE_16BIT_MODES = ('I;16', 'I;16L', 'I;16B')
 
-def load_grayscale(uploaded_file):
-    img = Image.open(uploaded_file).convert('L')
-    return np.array(img) / 255.0
+def _to_working_dtype(buffer, max_val, dtype=np.float64):
+    out = np.empty(buffer.shape, dtype=dtype)
+    np.multiply(buffer, dtype(1.0 / max_val), out=out, casting='unsafe')
+    return out
+
+def decode_image(uploaded_file):
+    """
+    Decodes the image once and returns (mode, buffer, max_val) with the raw
+    uint8/uint16 pixels: (H, W) for 'L' or a (3, H, W) view for 'RGB'.
+    Raises ValueError for any other image mode.
+    """
+    with Image.open(uploaded_file) as img:
+        if img.mode == 'L':
+            return 'L', np.asarray(img, dtype=np.uint8), 255
+
+        if img.mode in GRAYSCALE_16BIT_MODES:
+            return 'L', np.asarray(img), 65535
+
+        if img.mode == 'RGB':
+            return 'RGB', np.asarray(img, dtype=np.uint8).transpose(2, 0, 1), 255
+
+    raise ValueError(f"Modo de imagen no soportado: {img.mode}")
+
+def buffer_to_channels(mode, buffer, max_val):
+    """
+    Converts a decoded buffer straight to float64 in [0, 1] and returns
+    (gray,) or (r, g, b), each a contiguous view of a single array.
+    """
+    channels = _to_working_dtype(buffer, max_val)
+    if mode == 'L':
+        return (channels,)
+    return channels[0], channels[1], channels[2]
 
 def load_image_auto_channels(uploaded_file):
-    img = Image.open(uploaded_file)
-    if img.mode == 'L':
-        gray = load_grayscale(uploaded_file)
-        return 'L', (gray,)
-    else:
-        r, g, b = load_rgb_channels(uploaded_file)
-        return 'RGB', (r, g, b)
+    mode, buffer, max_val = decode_image(uploaded_file)
+    return mode, buffer_to_channels(mode, buffer, max_val)
+
+def load_example_images(directory="assets"):
+    """
+    Decodes every PNG in `directory` once and returns a read-only store
+    {file name: (mode, buffer, max_val)} sorted by file name.
+
+    Assets in other modes (palette, RGBA...) are converted to RGB once here;
+    files that cannot be decoded are skipped with a warning.
+    """
+    store = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.png"))):
+        try:
+            try:
+                mode, buffer, max_val = decode_image(path)
+            except ValueError:
+                with Image.open(path) as img:
+                    buffer = np.asarray(img.convert('RGB'), dtype=np.uint8).transpose(2, 0, 1)
+                mode, max_val = 'RGB', 255
+        except OSError as e:
+            warnings.warn(f"Imagen de ejemplo ignorada {path}: {e}")
+            continue
+        buffer.flags.writeable = False
+        store[os.path.basename(path)] = (mode, buffer, max_val)
+    return store
 
 def recombine_rgb_channels(r, g, b):
     rgb = np.stack([r, g, b], axis=-1)
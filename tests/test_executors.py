@@ -0,0 +1,163 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from concurrent.futures.process import BrokenProcessPool
+
+from app.executors import SweepExecutor, LocalProcessExecutor, fresnel_task, get_executor
+
+
+D = 1e-2
+Z_VALS = [0.1, 0.2, 0.3]
+WAVELENGTHS = [560e-9, 530e-9, 430e-9]
+
+
+def _inputs():
+    rng = np.random.default_rng(0)
+    return [rng.random((32, 32)) for _ in WAVELENGTHS]
+
+
+def _tasks():
+    return [(c, z, D, wl) for c, wl in enumerate(WAVELENGTHS) for z in Z_VALS]
+
+
+def _serial(inputs, tasks):
+    return [fresnel_task(inputs[c], *args) for c, *args in tasks]
+
+
+class SerialExecutor(SweepExecutor):
+    def run_sweep(self, func, inputs, tasks, on_progress=None):
+        outs = []
+        for input_idx, *args in tasks:
+            outs.append(func(inputs[input_idx], *args))
+            if on_progress is not None:
+                on_progress(len(outs), len(tasks))
+        return outs
+
+
+def test_incomplete_backend_fails_on_creation():
+    class Incomplete(SweepExecutor):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_local_executor_matches_serial_run():
+    inputs, tasks = _inputs(), _tasks()
+    executor = LocalProcessExecutor(max_workers=2)
+    progress = []
+    try:
+        outs = executor.run_sweep(fresnel_task, inputs, tasks, lambda done, total: progress.append((done, total)))
+    finally:
+        executor.close()
+
+    for out, expected in zip(outs, _serial(inputs, tasks)):
+        np.testing.assert_allclose(out, expected)
+    assert progress == [(i, len(tasks)) for i in range(1, len(tasks) + 1)]
+
+
+def test_dask_executor_matches_serial_run():
+    pytest.importorskip("distributed")
+    from app.executors import DaskExecutor
+
+    inputs, tasks = _inputs(), _tasks()
+    executor = DaskExecutor(processes=False)
+    progress = []
+    try:
+        outs = executor.run_sweep(fresnel_task, inputs, tasks, lambda done, total: progress.append((done, total)))
+    finally:
+        executor.close()
+
+    assert len(outs) == len(tasks)
+    for out, expected in zip(outs, _serial(inputs, tasks)):
+        np.testing.assert_allclose(out, expected)
+    assert progress == [(i, len(tasks)) for i in range(1, len(tasks) + 1)]
+
+
+def test_get_executor_requires_dask_scheduler(monkeypatch):
+    monkeypatch.setenv("FRESNEL_EXECUTOR", "dask")
+    monkeypatch.delenv("FRESNEL_DASK_SCHEDULER", raising=False)
+    get_executor.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="FRESNEL_DASK_SCHEDULER"):
+            get_executor()
+    finally:
+        get_executor.cache_clear()
+
+
+def test_compute_rgb_outputs_splits_channels(monkeypatch):
+    pytest.importorskip("streamlit")
+    from app import processing_flows
+
+    monkeypatch.setattr(processing_flows, "get_executor", SerialExecutor)
+    r, g, b = _inputs()
+
+    result = processing_flows.compute_rgb_outputs(r, g, b, Z_VALS, D)
+
+    for key, channel, wl in [('r_outs', r, 560e-9), ('g_outs', g, 530e-9), ('b_outs', b, 430e-9)]:
+        assert len(result[key]) == len(Z_VALS)
+        for out, z in zip(result[key], Z_VALS):
+            np.testing.assert_allclose(out, fresnel_task(channel, z, D, wl))
+    assert len(result['rgb_outs']) == len(Z_VALS)
+    assert result['rgb_outs'][0].shape == (32, 32, 3)
+
+
+def _fail_on_first_input(img, z):
+    if z == 0:
+        raise RuntimeError("fallo")
+    return z
+
+
+def test_local_executor_recovers_after_failed_task():
+    executor = LocalProcessExecutor(max_workers=2)
+    try:
+        with pytest.raises(RuntimeError):
+            executor.run_sweep(_fail_on_first_input, [None], [(0, z) for z in range(20)])
+
+        assert executor.run_sweep(_fail_on_first_input, [None], [(0, z) for z in range(1, 4)]) == [1, 2, 3]
+    finally:
+        executor.close()
+
+
+def _crash_worker(img, z):
+    if z == 0:
+        os._exit(1)
+    return z
+
+
+def test_local_executor_concurrent_sweeps_when_pool_breaks():
+    executor = LocalProcessExecutor(max_workers=2)
+    errors = []
+    barrier = threading.Barrier(3)
+
+    def sweep(first_z):
+        barrier.wait()
+        try:
+            executor.run_sweep(_crash_worker, [None], [(0, z) for z in range(first_z, first_z + 20)])
+        except BaseException as e:
+            errors.append(e)
+
+    try:
+        threads = [threading.Thread(target=sweep, args=(first_z,)) for first_z in (0, 0, 1)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+
+        assert errors
+        assert all(isinstance(e, BrokenProcessPool) for e in errors)
+
+        pools = []
+        threads = [threading.Thread(target=lambda: pools.append(executor._get_pool())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(p) for p in pools}) == 1
+
+        assert executor.run_sweep(_crash_worker, [None], [(0, z) for z in range(1, 4)]) == [1, 2, 3]
+    finally:
+        executor.close()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.image_utils import load_image_auto_channels, load_example_images
+
+
+def test_load_16bit_grayscale_png(tmp_path):
+    pixels = (np.arange(32 * 32).reshape(32, 32) * 64).astype(np.uint16)
+    path = tmp_path / "gray16.png"
+    Image.fromarray(pixels).save(path)
+    assert Image.open(path).mode == 'I;16'
+
+    mode, (gray,) = load_image_auto_channels(path)
+
+    assert mode == 'L'
+    assert gray.dtype == np.float64
+    np.testing.assert_allclose(gray, pixels / 65535.0)
+
+
+def test_load_rgb_matches_channels(tmp_path):
+    pixels = np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    path = tmp_path / "rgb.png"
+    Image.fromarray(pixels, mode='RGB').save(path)
+
+    mode, channels = load_image_auto_channels(path)
+
+    assert mode == 'RGB'
+    for i, channel in enumerate(channels):
+        assert channel.flags.c_contiguous
+        np.testing.assert_allclose(channel, pixels[..., i] / 255.0)
+
+
+@pytest.mark.parametrize("mode", ['RGBA', 'P', 'I'])
+def test_unsupported_mode_raises(tmp_path, mode):
+    path = tmp_path / "unsupported.tiff"
+    Image.new(mode, (8, 8)).save(path)
+
+    with pytest.raises(ValueError):
+        load_image_auto_channels(path)
+
+
+def test_example_store_is_read_only(tmp_path):
+    Image.new('L', (8, 8), 128).save(tmp_path / "a.png")
+
+    store = load_example_images(str(tmp_path))
+
+    mode, buffer, max_val = store["a.png"]
+    assert (mode, buffer.dtype, max_val) == ('L', np.uint8, 255)
+    assert not buffer.flags.writeable
+
+
+def test_example_store_converts_or_skips_unsupported_assets(tmp_path):
+    Image.new('P', (8, 8)).save(tmp_path / "palette.png")
+    Image.new('RGBA', (8, 8), (10, 20, 30, 40)).save(tmp_path / "rgba.png")
+    (tmp_path / "broken.png").write_bytes(b"not a png")
+
+    with pytest.warns(UserWarning, match="broken.png"):
+        store = load_example_images(str(tmp_path))
+
+    assert list(store) == ["palette.png", "rgba.png"]
+    mode, buffer, max_val = store["rgba.png"]
+    assert (mode, buffer.shape, max_val) == ('RGB', (3, 8, 8), 255)
+    assert buffer[:, 0, 0].tolist() == [10, 20, 30]